@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Optional, List
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, validator, Field
 import logging
 
 from zodiac import infer_zodiac
@@ -18,6 +18,7 @@ class PredictRequest(BaseModel):
     birth_time: Optional[str] = None  # HH:MM (optional)
     birth_place: Optional[str] = None
     language: Optional[str] = "en"
+    tz: Optional[str] = None  # IANA timezone of birth_time, e.g. "Asia/Kolkata"
 
     @validator("birth_date")
     def validate_birth_date(cls, v):
@@ -44,6 +45,26 @@ class PredictRequest(BaseModel):
             raise ValueError("birth_time must be a valid time")
         return v
 
+    @validator("tz")
+    def validate_tz(cls, v):
+        if v is None or v == "":
+            return None
+        from zoneinfo import ZoneInfo
+        try:
+            ZoneInfo(v)
+        except Exception:
+            raise ValueError("tz must be an IANA timezone name like Asia/Kolkata")
+        return v
+
+
+def _infer_zodiac(req: PredictRequest) -> str:
+    # tz is the only timezone source here; birth_place is not geocoded in the
+    # request path, so without tz the birth time is taken as UTC
+    try:
+        return infer_zodiac(req.birth_date, req.birth_time, tz=req.tz)
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Could not infer zodiac: {e}")
+
 
 class PredictResponse(BaseModel):
     zodiac: str
@@ -55,10 +76,7 @@ class PredictResponse(BaseModel):
 async def predict(req: PredictRequest):
     logger.info("Received predict request: %s", req.json())
 
-    try:
-        zodiac = infer_zodiac(req.birth_date, req.birth_time)
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Could not infer zodiac: {e}")
+    zodiac = _infer_zodiac(req)
 
     profile = cache.get_profile(req.name)
 
@@ -77,6 +95,47 @@ async def predict(req: PredictRequest):
     return PredictResponse(zodiac=zodiac, insight=insight, language=req.language or "en")
 
 
+class ForecastRequest(PredictRequest):
+    days: int = Field(7, ge=1, le=31)
+
+
+class ForecastDay(BaseModel):
+    date: str
+    insight: str
+
+
+class ForecastResponse(BaseModel):
+    zodiac: str
+    forecast: List[ForecastDay]
+    language: str
+
+
+@app.post("/forecast", response_model=ForecastResponse)
+async def forecast(req: ForecastRequest):
+    logger.info("Received forecast request: %s", req.json())
+
+    zodiac = _infer_zodiac(req)
+
+    profile = cache.get_profile(req.name)
+
+    days = generator.generate_forecast(
+        name=req.name,
+        zodiac=zodiac,
+        days=req.days,
+        birth_place=req.birth_place,
+        birth_date=req.birth_date,
+        birth_time=req.birth_time,
+        profile=profile,
+        language=req.language or "en",
+    )
+
+    cache.update_profile(req.name, {"last_used": req.birth_date})
+
+    return ForecastResponse(zodiac=zodiac,
+                            forecast=[ForecastDay(**d) for d in days],
+                            language=req.language or "en")
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok"}
@@ -0,0 +1,66 @@
+"""
+bench_forecast.py
+
+Compare one N-day forecast against N single /predict-style calls.
+Both paths run the same work the API does per request (zodiac inference,
+profile read, generation, profile update) against the local stubs.
+
+Usage: python bench_forecast.py [days] [repeats]
+"""
+import os
+import sys
+import time
+import logging
+import tempfile
+
+from zodiac import infer_zodiac
+import generator
+import cache
+
+logging.disable(logging.INFO)
+
+NAME = "BenchUser"
+BIRTH_DATE = "1995-08-20"
+BIRTH_TIME = "14:30"
+
+
+def single_predictions(days: int):
+    out = []
+    for _ in range(days):
+        zodiac = infer_zodiac(BIRTH_DATE, BIRTH_TIME)
+        profile = cache.get_profile(NAME)
+        out.append(generator.generate_insight(name=NAME, zodiac=zodiac, profile=profile,
+                                              birth_date=BIRTH_DATE, birth_time=BIRTH_TIME))
+        cache.update_profile(NAME, {"last_used": BIRTH_DATE})
+    return out
+
+
+def one_forecast(days: int):
+    zodiac = infer_zodiac(BIRTH_DATE, BIRTH_TIME)
+    profile = cache.get_profile(NAME)
+    out = generator.generate_forecast(name=NAME, zodiac=zodiac, days=days, profile=profile,
+                                      birth_date=BIRTH_DATE, birth_time=BIRTH_TIME)
+    cache.update_profile(NAME, {"last_used": BIRTH_DATE})
+    return out
+
+
+def _best_of(fn, days: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        fn(days)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+if __name__ == "__main__":
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    # keep the benchmark user out of the live profile store
+    with tempfile.TemporaryDirectory() as tmp:
+        cache._CACHE_FILE = os.path.join(tmp, "profiles.json")
+        t_single = _best_of(single_predictions, days, repeats)
+        t_forecast = _best_of(one_forecast, days, repeats)
+    print(f"{days} x generate_insight: {t_single * 1000:.2f} ms")
+    print(f"generate_forecast({days}):  {t_forecast * 1000:.2f} ms")
+    print(f"speedup: {t_single / t_forecast:.1f}x")
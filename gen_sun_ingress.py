@@ -0,0 +1,379 @@
+"""
+gen_sun_ingress.py
+
+Offline generator for data/sun_ingress.npz, the table used by zodiac.infer_zodiac.
+
+For every 30-degree step of the Sun's apparent geocentric (tropical) longitude
+between 1900 and 2100 it records the ingress instant as integer Unix seconds (UTC).
+
+Method:
+- Solar longitude from Meeus, "Astronomical Algorithms" ch. 25 (higher accuracy):
+  truncated VSOP87 Earth series from Meeus appendix III, FK5 correction, nutation
+  (ch. 22 abbreviated) and aberration. Accurate to about 1 arcsecond, i.e. ingress
+  instants within about half a minute of the full theory.
+- TT -> UT via the Espenak/Meeus delta-T polynomials. Delta-T after ~2025 is an
+  extrapolation, so far-future instants carry its uncertainty (a minute or more by 2100).
+- 5-day scan for sign changes, then bisection down to one second.
+
+The output is fully determined by this script (no network, no clock, no randomness).
+
+Usage: python gen_sun_ingress.py [output_path]
+"""
+import math
+import os
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+
+OUTPUT_PATH = "data/sun_ingress.npz"
+
+# scan window: starts before 1900-01-01 and ends after 2100-12-31 so the table
+# brackets every instant in [1900, 2100]
+SCAN_START = datetime(1899, 12, 1, tzinfo=timezone.utc)
+SCAN_END = datetime(2101, 2, 1, tzinfo=timezone.utc)
+
+_UNIX_EPOCH_JD = 2440587.5
+_J2000 = 2451545.0
+_ARCSEC = 1.0 / 3600.0
+
+# VSOP87 Earth heliocentric longitude (L) and radius vector (R) terms, truncated as in
+# Meeus appendix III. Each term is (A, B, C) contributing A * cos(B + C * tau), in 1e-8 rad/AU.
+_EARTH_L = [
+    # L0
+    [
+        (175347045.673, 0.00000000000, 0.0000000000),
+        (3341656.456, 4.66925680417, 6283.0758499914),
+        (34894.275, 4.62610241759, 12566.1516999828),
+        (3497.056, 2.74411800971, 5753.3848848968),
+        (3417.571, 2.82886579606, 3.5231183490),
+        (3135.896, 3.62767041758, 77713.7714681205),
+        (2676.218, 4.41808351397, 7860.4193924392),
+        (2342.687, 6.13516237631, 3930.2096962196),
+        (1324.292, 0.74246356352, 11506.7697697936),
+        (1273.166, 2.03709655772, 529.6909650946),
+        (1199.167, 1.10962944315, 1577.3435424478),
+        (990.250, 5.23268129594, 5884.9268465832),
+        (901.855, 2.04505443513, 26.2983197998),
+        (857.223, 3.50849156957, 398.1490034082),
+        (779.786, 1.17882652114, 5223.6939198022),
+        (753.141, 2.53339053818, 5507.5532386674),
+        (505.264, 4.58292563052, 18849.2275499742),
+        (492.379, 4.20506639861, 775.5226113240),
+        (356.655, 2.91954116867, 0.0673103028),
+        (317.087, 5.84901952218, 11790.6290886588),
+        (284.125, 1.89869034186, 796.2980068164),
+        (271.039, 0.31488607649, 10977.0788046990),
+        (242.810, 0.34481140906, 5486.7778431750),
+        (206.160, 4.80646606059, 2544.3144198834),
+        (205.385, 1.86947813692, 5573.1428014331),
+        (202.261, 2.45767795458, 6069.7767545534),
+        (155.516, 0.83306073807, 213.2990954380),
+        (132.212, 3.41118275555, 2942.4634232916),
+        (126.184, 1.08302630210, 20.7753954924),
+        (115.132, 0.64544911683, 0.9803210682),
+        (102.851, 0.63599846727, 4694.0029547076),
+        (101.895, 0.97569221824, 15720.8387848784),
+        (101.724, 4.26679821365, 7.1135470008),
+        (99.206, 6.20992940258, 2146.1654164752),
+        (97.607, 0.68101272270, 155.4203994342),
+        (85.803, 5.98322631256, 161000.6857376741),
+        (85.128, 1.29870743025, 6275.9623029906),
+        (84.711, 3.67080093025, 71430.6956181291),
+        (79.637, 1.80791330700, 17260.1546546904),
+        (78.756, 3.03698313141, 12036.4607348882),
+        (74.651, 1.75508916159, 5088.6288397668),
+        (73.874, 3.50319443167, 3154.6870848956),
+        (73.547, 4.67926565481, 801.8209311238),
+        (69.627, 0.83297596966, 9437.7629348870),
+        (62.449, 3.97763880587, 8827.3902698748),
+        (61.148, 1.81839811024, 7084.8967811152),
+        (56.963, 2.78430398043, 6286.5989683404),
+        (56.116, 4.38694880779, 14143.4952424306),
+        (55.577, 3.47006009062, 6279.5527316424),
+        (51.992, 0.18914945834, 12139.5535091068),
+        (51.605, 1.33282746983, 1748.0164130670),
+        (51.145, 0.28306864501, 5856.4776591154),
+        (49.000, 0.48735065033, 1194.4470102246),
+        (41.036, 5.36817351402, 8429.2412664666),
+        (40.938, 2.39850881707, 19651.0484810980),
+        (39.200, 6.16832995016, 10447.3878396044),
+        (36.770, 6.04133859347, 10213.2855462110),
+        (36.596, 2.56955238628, 1059.3819301892),
+        (35.954, 1.70876111898, 2352.8661537718),
+        (35.566, 1.77597314691, 6812.7668150860),
+        (33.291, 0.59309499459, 17789.8456197850),
+        (30.412, 0.44294464135, 83996.8473181119),
+        (30.047, 2.73975123935, 1349.8674096588),
+        (25.352, 3.16470953405, 4690.4798363586),
+    ],
+    # L1
+    [
+        (628331966747.491, 0.00000000000, 0.0000000000),
+        (206058.863, 2.67823455584, 6283.0758499914),
+        (4303.430, 2.63512650414, 12566.1516999828),
+        (425.264, 1.59046980729, 3.5231183490),
+        (119.261, 5.79557487799, 26.2983197998),
+        (108.977, 2.96618001993, 1577.3435424478),
+        (93.478, 2.59212835365, 18849.2275499742),
+        (72.122, 1.13846158196, 529.6909650946),
+        (67.768, 1.87472304791, 398.1490034082),
+        (67.327, 4.40918235168, 5507.5532386674),
+        (59.027, 2.88797038460, 5223.6939198022),
+        (55.976, 2.17471680261, 155.4203994342),
+        (45.407, 0.39803079805, 796.2980068164),
+        (36.369, 0.46624739835, 775.5226113240),
+        (28.958, 2.64707383882, 7.1135470008),
+        (20.844, 5.34138275149, 0.9803210682),
+        (19.097, 1.84628332577, 5486.7778431750),
+        (18.508, 4.96855124577, 213.2990954380),
+        (17.293, 2.99116864949, 6275.9623029906),
+        (16.233, 0.03216483047, 2544.3144198834),
+        (15.832, 1.43049285325, 2146.1654164752),
+        (14.615, 1.20532366323, 10977.0788046990),
+        (12.461, 2.83432285512, 1748.0164130670),
+        (11.877, 3.25804815607, 5088.6288397668),
+        (11.808, 5.27379790480, 1194.4470102246),
+        (11.514, 2.07502418155, 4694.0029547076),
+        (10.641, 0.76614199202, 553.5694028424),
+        (9.969, 1.30262991097, 6286.5989683404),
+        (9.721, 4.23925472239, 1349.8674096588),
+        (9.452, 2.69957062864, 242.7286039740),
+        (8.577, 5.64475868067, 951.7184062506),
+        (7.576, 5.30062664886, 2352.8661537718),
+        (6.385, 2.65033984967, 9437.7629348870),
+        (6.101, 4.66632584188, 4690.4798363586),
+    ],
+    # L2
+    [
+        (52918.870, 0.00000000000, 0.0000000000),
+        (8719.837, 1.07209665242, 6283.0758499914),
+        (309.125, 0.86728818832, 12566.1516999828),
+        (27.339, 0.05297871691, 3.5231183490),
+        (16.334, 5.18826691036, 26.2983197998),
+        (15.752, 3.68457889430, 155.4203994342),
+        (9.541, 0.75742297675, 18849.2275499742),
+        (8.937, 2.05705419118, 77713.7714681205),
+        (6.952, 0.82673305410, 775.5226113240),
+        (5.064, 4.66284525271, 1577.3435424478),
+        (4.061, 1.03057162962, 7.1135470008),
+        (3.810, 3.44050803490, 5573.1428014331),
+        (3.463, 5.14074632811, 796.2980068164),
+        (3.169, 6.05291851171, 5507.5532386674),
+        (3.020, 1.19246506441, 242.7286039740),
+        (2.886, 6.11652627155, 529.6909650946),
+        (2.714, 0.30637881025, 398.1490034082),
+        (2.538, 2.27992810679, 553.5694028424),
+        (2.371, 4.38118838167, 5223.6939198022),
+        (2.079, 3.75435330484, 0.9803210682),
+    ],
+    # L3
+    [
+        (289.226, 5.84384198723, 6283.0758499914),
+        (34.955, 0.00000000000, 0.0000000000),
+        (16.819, 5.48766912348, 12566.1516999828),
+        (2.962, 5.19577265202, 155.4203994342),
+        (1.288, 4.72200252235, 3.5231183490),
+        (0.714, 5.30045809128, 18849.2275499742),
+        (0.635, 5.96925937141, 242.7286039740),
+    ],
+    # L4
+    [
+        (114.084, 3.14159265359, 0.0000000000),
+        (7.717, 4.13446589358, 6283.0758499914),
+        (0.765, 3.83803776214, 12566.1516999828),
+    ],
+    # L5
+    [
+        (0.878, 3.14159265359, 0.0000000000),
+    ],
+]
+
+_EARTH_R = [
+    # R0
+    [
+        (100013988.799, 0.00000000000, 0.0000000000),
+        (1670699.626, 3.09846350771, 6283.0758499914),
+        (13956.023, 3.05524609620, 12566.1516999828),
+        (3083.720, 5.19846674381, 77713.7714681205),
+        (1628.461, 1.17387749012, 5753.3848848968),
+        (1575.568, 2.84685245825, 7860.4193924392),
+        (924.799, 5.45292234084, 11506.7697697936),
+        (542.444, 4.56409149777, 3930.2096962196),
+        (472.110, 3.66100022149, 5884.9268465832),
+        (345.983, 0.96368617687, 5507.5532386674),
+        (328.780, 5.89983646482, 5223.6939198022),
+        (306.784, 0.29867139512, 5573.1428014331),
+        (243.189, 4.27349536153, 11790.6290886588),
+        (211.829, 5.84714540314, 1577.3435424478),
+        (185.752, 5.02194447178, 10977.0788046990),
+        (174.844, 3.01193636534, 18849.2275499742),
+        (109.835, 5.05510636285, 5486.7778431750),
+        (98.316, 0.88681311277, 6069.7767545534),
+        (86.499, 5.68959778254, 15720.8387848784),
+        (85.825, 1.27083733351, 161000.6857376741),
+        (64.903, 0.27250613787, 17260.1546546904),
+        (62.916, 0.92177108832, 529.6909650946),
+        (57.056, 2.01374292014, 83996.8473181119),
+        (55.736, 5.24159798933, 71430.6956181291),
+        (49.384, 3.24501240359, 2544.3144198834),
+        (46.963, 2.57805070386, 775.5226113240),
+        (44.661, 5.53715807302, 9437.7629348870),
+        (42.515, 6.01110242003, 6275.9623029906),
+        (38.968, 5.36071738169, 4694.0029547076),
+        (38.245, 2.39255343974, 8827.3902698748),
+        (37.490, 0.82952922332, 19651.0484810980),
+        (36.957, 4.90107591914, 12139.5535091068),
+        (35.660, 1.67468058995, 12036.4607348882),
+        (34.537, 1.84270693282, 2942.4634232916),
+        (33.193, 0.24370300098, 7084.8967811152),
+        (31.921, 0.18368229781, 5088.6288397668),
+        (31.846, 1.77775642085, 398.1490034082),
+        (28.464, 1.21344868176, 6286.5989683404),
+        (27.793, 1.89934330904, 6279.5527316424),
+        (26.275, 4.58896850401, 10447.3878396044),
+    ],
+    # R1
+    [
+        (103018.608, 1.10748969588, 6283.0758499914),
+        (1721.238, 1.06442301418, 12566.1516999828),
+        (702.215, 3.14159265359, 0.0000000000),
+        (32.346, 1.02169059149, 18849.2275499742),
+        (30.799, 2.84353804832, 5507.5532386674),
+        (24.971, 1.31906709482, 5223.6939198022),
+        (18.485, 1.42429748614, 1577.3435424478),
+        (10.078, 5.91378194648, 10977.0788046990),
+        (8.654, 1.42046854427, 6275.9623029906),
+        (8.634, 0.27146150602, 5486.7778431750),
+    ],
+    # R2
+    [
+        (4359.385, 5.78455133738, 6283.0758499914),
+        (123.633, 5.57934722157, 12566.1516999828),
+        (12.341, 3.14159265359, 0.0000000000),
+        (8.792, 3.62777733395, 77713.7714681205),
+        (5.689, 1.86958905084, 5573.1428014331),
+        (3.301, 5.47027913302, 18849.2275499742),
+    ],
+    # R3
+    [
+        (144.595, 4.27319435148, 6283.0758499914),
+        (6.729, 3.91697608662, 12566.1516999828),
+    ],
+    # R4
+    [
+        (3.858, 2.56384387339, 6283.0758499914),
+    ],
+]
+
+
+def _delta_t_seconds(year: float) -> float:
+    """TT - UT in seconds (Espenak & Meeus polynomial fits, 1900-2150)."""
+    if year < 1920:
+        t = year - 1900
+        return -2.79 + 1.494119 * t - 0.0598939 * t**2 + 0.0061966 * t**3 - 0.000197 * t**4
+    if year < 1941:
+        t = year - 1920
+        return 21.20 + 0.84493 * t - 0.076100 * t**2 + 0.0020936 * t**3
+    if year < 1961:
+        t = year - 1950
+        return 29.07 + 0.407 * t - t**2 / 233 + t**3 / 2547
+    if year < 1986:
+        t = year - 1975
+        return 45.45 + 1.067 * t - t**2 / 260 - t**3 / 718
+    if year < 2005:
+        t = year - 2000
+        return (63.86 + 0.3345 * t - 0.060374 * t**2 + 0.0017275 * t**3
+                + 0.000651814 * t**4 + 0.00002373599 * t**5)
+    if year < 2050:
+        t = year - 2000
+        return 62.92 + 0.32217 * t + 0.005589 * t**2
+    return -20 + 32 * ((year - 1820) / 100) ** 2 - 0.5628 * (2150 - year)
+
+
+def _vsop_sum(series, tau: float) -> float:
+    total = 0.0
+    power = 1.0
+    for terms in series:
+        total += power * sum(a * math.cos(b + c * tau) for a, b, c in terms)
+        power *= tau
+    return total * 1e-8
+
+
+def sun_apparent_longitude(unix_seconds: float) -> float:
+    """Apparent tropical longitude of the Sun in degrees [0, 360) at a UTC instant."""
+    jd_ut = _UNIX_EPOCH_JD + unix_seconds / 86400.0
+    year = 2000.0 + (jd_ut - _J2000) / 365.25
+    jde = jd_ut + _delta_t_seconds(year) / 86400.0
+    tau = (jde - _J2000) / 365250.0
+    T = tau * 10.0
+
+    # geocentric longitude = heliocentric longitude of the Earth + 180 deg
+    theta = math.degrees(_vsop_sum(_EARTH_L, tau)) + 180.0
+    R = _vsop_sum(_EARTH_R, tau)
+
+    # conversion to the FK5 system (latitude term is below 0.001")
+    theta -= 0.09033 * _ARCSEC
+
+    # nutation in longitude
+    omega = math.radians(125.04452 - 1934.136261 * T)
+    L_sun = math.radians(280.4665 + 36000.7698 * T)
+    L_moon = math.radians(218.3165 + 481267.8813 * T)
+    dpsi = (-17.20 * math.sin(omega) - 1.32 * math.sin(2 * L_sun)
+            - 0.23 * math.sin(2 * L_moon) + 0.21 * math.sin(2 * omega)) * _ARCSEC
+
+    aberration = -20.4898 * _ARCSEC / R
+    return (theta + dpsi + aberration) % 360.0
+
+
+def _sign_index(unix_seconds: float) -> int:
+    return int(sun_apparent_longitude(unix_seconds) // 30.0) % 12
+
+
+def _refine(lo: int, hi: int) -> int:
+    """Bisect to the first second whose sign differs from the sign at `lo`."""
+    start_sign = _sign_index(lo)
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if _sign_index(mid) == start_sign:
+            lo = mid
+        else:
+            hi = mid
+    return hi
+
+
+def compute_ingresses(start: datetime = SCAN_START, end: datetime = SCAN_END):
+    """Return (first_sign, instants) for ingresses in [start, end): instants[i] is the ingress
+    into sign (first_sign + i) % 12."""
+    # signs last at least 29 days, so a 5-day step cannot skip one
+    step = 5 * 86400
+    t = int(start.timestamp())
+    end = int(end.timestamp())
+    prev_sign = _sign_index(t)
+    first_sign = None
+    instants = []
+    while t < end:
+        nxt = t + step
+        sign = _sign_index(nxt)
+        if sign != prev_sign:
+            if sign != (prev_sign + 1) % 12:
+                raise RuntimeError(f"non-consecutive sign change at {t}")
+            if first_sign is None:
+                first_sign = sign
+            instants.append(_refine(t, nxt))
+            prev_sign = sign
+        t = nxt
+    return first_sign, np.asarray(instants, dtype=np.int64)
+
+
+def main(path: str = OUTPUT_PATH):
+    first_sign, instants = compute_ingresses()
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    np.savez_compressed(path, first_sign=np.int8(first_sign), ingress_utc=instants)
+    print(f"wrote {len(instants)} ingresses to {path} "
+          f"({datetime.fromtimestamp(int(instants[0]), timezone.utc).isoformat()} .. "
+          f"{datetime.fromtimestamp(int(instants[-1]), timezone.utc).isoformat()})")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else OUTPUT_PATH)
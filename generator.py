@@ -1,4 +1,5 @@
-from typing import Optional, List
+from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
 from translate_stub import translate_text
 from embeddings_stub import embed_texts
 from vector_store import retrieve_similar
@@ -41,7 +42,7 @@ def _call_hf_api(prompt: str, model: str = "google/flan-t5-small", max_length: i
     # fallback to stringified JSON
     return str(data)
 
-def _invoke_llm(prompt: str) -> str:
+def _invoke_llm(prompt: str, **pseudo_hints) -> str:
     # priority: OpenAI -> HF -> pseudo LLM
     if USE_OPENAI:
         try:
@@ -53,8 +54,53 @@ def _invoke_llm(prompt: str) -> str:
             return _call_hf_api(prompt)
         except Exception:
             logger.exception("HF call failed, falling back")
-    return pseudo_llm_generate(prompt)
-  
+    return pseudo_llm_generate(prompt, **pseudo_hints)
+
+def _invoke_openai_or_pseudo(prompt: str, **pseudo_hints) -> str:
+    try:
+        return _call_openai(prompt)
+    except Exception:
+        logger.exception("OpenAI call failed, falling back")
+    return pseudo_llm_generate(prompt, **pseudo_hints)
+
+def _invoke_llm_batch(prompts: List[str], pseudo_hints: List[dict]) -> List[str]:
+    # OpenAI chat has no batch call, so fan the prompts out over a small thread
+    # pool; HF inference accepts a list of inputs in one request. Neither path
+    # retries HF per prompt: after a failed batch every day goes straight to the
+    # pseudo LLM. pseudo_hints[i] is passed to the pseudo LLM for prompts[i].
+    if USE_OPENAI:
+        with ThreadPoolExecutor(max_workers=min(8, len(prompts) or 1)) as pool:
+            return list(pool.map(lambda ph: _invoke_openai_or_pseudo(ph[0], **ph[1]),
+                                  zip(prompts, pseudo_hints)))
+    if USE_HF:
+        try:
+            return _call_hf_api_batch(prompts)
+        except Exception:
+            logger.exception("HF batch call failed, falling back to pseudo LLM")
+    return [pseudo_llm_generate(p, **h) for p, h in zip(prompts, pseudo_hints)]
+
+def _call_hf_api_batch(prompts: List[str], model: str = "google/flan-t5-small", max_length: int = 200) -> List[str]:
+    if not HF_API_KEY:
+        raise RuntimeError("HF API key not configured")
+    api_url = f"https://api-inference.huggingface.co/models/{model}"
+    headers = {"Authorization": f"Bearer {HF_API_KEY}"}
+    payload = {"inputs": prompts, "parameters": {"max_new_tokens": max_length}}
+    r = requests.post(api_url, headers=headers, json=payload, timeout=60)
+    r.raise_for_status()
+    data = r.json()
+    if not isinstance(data, list) or len(data) != len(prompts):
+        raise RuntimeError("unexpected HF batch response shape")
+    out = []
+    for item in data:
+        # batched responses may nest one list per input
+        if isinstance(item, list) and item:
+            item = item[0]
+        if isinstance(item, dict) and "generated_text" in item:
+            out.append(item["generated_text"].strip())
+        else:
+            out.append(str(item))
+    return out
+
 def build_prompt(name: str,
                  zodiac: str,
                  profile_text: Optional[str] = "",
@@ -83,10 +129,12 @@ def build_prompt(name: str,
     return prompt
 
 
-def pseudo_llm_generate(prompt: str, name_hint: str = None, birth_date_hint: str = None) -> str:
+def pseudo_llm_generate(prompt: str, name_hint: str = None, birth_date_hint: str = None,
+                        for_date: str = None) -> str:
     """
     Lightweight, deterministic fallback LLM that uses:
       - name_hint and birth_date_hint (if provided) to make outputs unique per user
+      - for_date (if provided) to vary the output per forecast day
       - the prompt to detect zodiac and retrieved context
       - a small set of templates selected via a stable hash
     This avoids returning the exact same sentence for everyone.
@@ -107,6 +155,8 @@ def pseudo_llm_generate(prompt: str, name_hint: str = None, birth_date_hint: str
 
     # create a stable index from name+birth_date+ctx to choose a template
     key = (name_hint or "") + "|" + (birth_date_hint or "") + "|" + ctx_hint
+    if for_date:
+        key += "|" + for_date
     h = hashlib.sha256(key.encode("utf-8")).hexdigest()
     idx = int(h[-8:], 16)
 
@@ -157,31 +207,45 @@ def pseudo_llm_generate(prompt: str, name_hint: str = None, birth_date_hint: str
 
     now = datetime.date.today().isoformat()
     out = chosen.format(name=name_for_template, zodiac=zodiac) + extra + context_snippet
+    if for_date:
+        return f"{out} (forecast for {for_date}, generated {now})"
     return f"{out} (generated {now})"
 
 
-
-def generate_insight(name: str,
-                     zodiac: str,
-                     profile: Optional[dict] = None,
-                     birth_place: Optional[str] = None,
-                     birth_date: Optional[str] = None,
-                     birth_time: Optional[str] = None,
-                     language: str = "en") -> str:
-    profile_text = ""
+def _profile_to_text(profile) -> str:
     if isinstance(profile, dict):
         keys = ["tone", "last_used", "preference"]
         parts = []
         for k in keys:
             if k in profile:
                 parts.append(f"{k}:{profile[k]}")
-        profile_text = "; ".join(parts)
+        return "; ".join(parts)
     elif isinstance(profile, str):
-        profile_text = profile
+        return profile
+    return ""
+
 
+def _retrieve_context(name: str, zodiac: str) -> List[str]:
     seed_query = f"{name} {zodiac} daily advice"
     query_embedding = embed_texts([seed_query])[0]
-    retrieved = retrieve_similar(query_embedding, k=3)
+    return retrieve_similar(query_embedding, k=3)
+
+
+def _localize(english_out: str, language: str) -> str:
+    if not language or language.startswith("en"):
+        return english_out
+    return translate_text(english_out, target_lang=language)
+
+
+def generate_insight(name: str,
+                     zodiac: str,
+                     profile: Optional[dict] = None,
+                     birth_place: Optional[str] = None,
+                     birth_date: Optional[str] = None,
+                     birth_time: Optional[str] = None,
+                     language: str = "en") -> str:
+    profile_text = _profile_to_text(profile)
+    retrieved = _retrieve_context(name, zodiac)
 
     prompt = build_prompt(name=name,
                       zodiac=zodiac,
@@ -202,11 +266,48 @@ def generate_insight(name: str,
         # call pseudo directly with hints to ensure personalization even when LLMs are disabled
         english_out = pseudo_llm_generate(prompt, name_hint=name, birth_date_hint=birth_date)
 
-    if not language or language.startswith("en"):
-        return english_out
+    return _localize(english_out, language)
+
+
+def generate_forecast(name: str,
+                      zodiac: str,
+                      days: int = 7,
+                      profile: Optional[dict] = None,
+                      birth_place: Optional[str] = None,
+                      birth_date: Optional[str] = None,
+                      birth_time: Optional[str] = None,
+                      language: str = "en",
+                      start_date: Optional[datetime.date] = None) -> List[Dict[str, str]]:
+    """
+    Multi-day variant of generate_insight. Profile text, retrieval and the base
+    prompt are computed once per user; only the forecast date changes per day,
+    and the per-day LLM calls are issued as one batch.
+    Returns: [{"date": "YYYY-MM-DD", "insight": "..."}] in date order.
+    """
+    if days < 1:
+        raise ValueError("days must be >= 1")
+    start = start_date or datetime.date.today()
+    dates = [(start + datetime.timedelta(days=i)).isoformat() for i in range(days)]
+
+    profile_text = _profile_to_text(profile)
+    retrieved = _retrieve_context(name, zodiac)
+    base_prompt = build_prompt(name=name,
+                               zodiac=zodiac,
+                               profile_text=profile_text,
+                               retrieved_ctx=retrieved,
+                               birth_place=birth_place,
+                               birth_date=birth_date,
+                               birth_time=birth_time)
+    prompts = [f"{base_prompt} Forecast date: {d}." for d in dates]
+    hints = [{"name_hint": name, "birth_date_hint": birth_date, "for_date": d} for d in dates]
+
+    if USE_OPENAI or USE_HF:
+        english_outs = _invoke_llm_batch(prompts, hints)
     else:
-        translated = translate_text(english_out, target_lang=language)
-        return translated
+        english_outs = [pseudo_llm_generate(p, **h) for p, h in zip(prompts, hints)]
+
+    return [{"date": d, "insight": _localize(out, language)}
+            for d, out in zip(dates, english_outs)]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,63 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import app
+import cache
+
+client = TestClient(app.app)
+
+
+@pytest.fixture(autouse=True)
+def _tmp_profiles(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_CACHE_FILE", str(tmp_path / "profiles.json"))
+
+
+def test_forecast_returns_requested_days():
+    r = client.post("/forecast", json={"name": "Ritika", "birth_date": "1995-08-20", "days": 3})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["zodiac"] == "Leo"
+    assert body["language"] == "en"
+    assert len(body["forecast"]) == 3
+    assert len({d["date"] for d in body["forecast"]}) == 3
+
+
+@pytest.mark.parametrize("days", [0, 32])
+def test_forecast_rejects_days_out_of_range(days):
+    r = client.post("/forecast", json={"name": "Ritika", "birth_date": "1995-08-20", "days": days})
+    assert r.status_code == 422
+
+
+def test_forecast_cusp_uses_timezone():
+    # 12:30 IST is 07:00 UTC, before the 2000 March equinox (~07:35 UTC)
+    base = {"name": "Ritika", "birth_date": "2000-03-20", "tz": "Asia/Kolkata", "days": 1}
+    assert client.post("/forecast", json={**base, "birth_time": "12:30"}).json()["zodiac"] == "Pisces"
+    assert client.post("/forecast", json={**base, "birth_time": "13:30"}).json()["zodiac"] == "Aries"
+
+
+def test_predict_cusp_uses_timezone():
+    r = client.post("/predict", json={"name": "Ritika", "birth_date": "2000-03-20",
+                                      "birth_time": "12:30", "tz": "Asia/Kolkata"})
+    assert r.status_code == 200
+    assert r.json()["zodiac"] == "Pisces"
+
+
+def test_predict_rejects_unknown_tz():
+    r = client.post("/predict", json={"name": "Ritika", "birth_date": "2000-03-20", "tz": "Mars/Olympus"})
+    assert r.status_code == 422
+
+
+def test_birth_place_is_not_geocoded(monkeypatch):
+    import utils
+
+    def no_geocoder(*args, **kwargs):
+        raise AssertionError("birth_place must not be geocoded in the request path")
+
+    monkeypatch.setattr(utils, "Nominatim", no_geocoder)
+    r = client.post("/predict", json={"name": "Ritika", "birth_date": "2000-03-20", "birth_time": "12:30",
+                                      "birth_place": "Jaipur, India", "tz": "Asia/Kolkata"})
+    assert r.status_code == 200
+    assert r.json()["zodiac"] == "Pisces"
+    r = client.post("/forecast", json={"name": "Ritika", "birth_date": "2000-03-20", "birth_time": "12:30",
+                                       "birth_place": "Jaipur, India", "days": 1})
+    assert r.status_code == 200
@@ -1,6 +1,9 @@
+import datetime
+
 import pytest
 
-from generator import generate_insight
+import generator
+from generator import generate_insight, generate_forecast
 from zodiac import infer_zodiac
 
 def test_infer_zodiac_basic():
@@ -39,3 +42,74 @@ def test_generate_insight_empty_profile():
     insp = generate_insight(name="Alex", zodiac="Gemini", profile=None, language="en")
     assert isinstance(insp, str)
     assert len(insp) > 0
+
+def test_generate_forecast_days_and_dates():
+    start = datetime.date(2025, 1, 30)
+    fc = generate_forecast(
+        name="Ritika",
+        zodiac="Leo",
+        days=7,
+        profile={"tone": "short"},
+        birth_date="1995-08-20",
+        start_date=start,
+    )
+    assert len(fc) == 7
+    assert [d["date"] for d in fc] == [(start + datetime.timedelta(days=i)).isoformat() for i in range(7)]
+    for d in fc:
+        assert f"forecast for {d['date']}" in d["insight"]
+
+def test_generate_forecast_hi():
+    fc = generate_forecast(name="Ritika", zodiac="Leo", days=2, language="hi")
+    assert all(d["insight"].startswith("[HI]") for d in fc)
+
+def test_generate_forecast_rejects_zero_days():
+    with pytest.raises(ValueError):
+        generate_forecast(name="Alex", zodiac="Gemini", days=0)
+
+def test_generate_forecast_shares_per_user_work(monkeypatch):
+    calls = {"embed": 0, "retrieve": 0}
+    real_embed, real_retrieve = generator.embed_texts, generator.retrieve_similar
+
+    def counting_embed(texts):
+        calls["embed"] += 1
+        return real_embed(texts)
+
+    def counting_retrieve(emb, k=3):
+        calls["retrieve"] += 1
+        return real_retrieve(emb, k=k)
+
+    monkeypatch.setattr(generator, "embed_texts", counting_embed)
+    monkeypatch.setattr(generator, "retrieve_similar", counting_retrieve)
+    fc = generate_forecast(name="Ritika", zodiac="Leo", days=30)
+    assert len(fc) == 30
+    assert calls == {"embed": 1, "retrieve": 1}
+
+def test_generate_forecast_llm_failure_falls_back_per_day(monkeypatch):
+    def failing_openai(prompt, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(generator, "USE_OPENAI", True)
+    monkeypatch.setattr(generator, "_call_openai", failing_openai)
+    start = datetime.date(2025, 1, 1)
+    fc = generate_forecast(name="Ritika", zodiac="Leo", days=5, birth_date="1995-08-20", start_date=start)
+    for d in fc:
+        assert f"forecast for {d['date']}" in d["insight"]
+    # the fallback is seeded per day, so the bodies are not all identical
+    bodies = {d["insight"].split(" (forecast for")[0] for d in fc}
+    assert len(bodies) > 1
+
+def test_generate_forecast_hf_batch_failure_skips_per_prompt_hf(monkeypatch):
+    def failing_batch(prompts, **kwargs):
+        raise RuntimeError("hf down")
+
+    def unexpected_single(prompt, **kwargs):
+        raise AssertionError("_call_hf_api must not be called after a failed batch")
+
+    monkeypatch.setattr(generator, "USE_HF", True)
+    monkeypatch.setattr(generator, "USE_OPENAI", False)
+    monkeypatch.setattr(generator, "_call_hf_api_batch", failing_batch)
+    monkeypatch.setattr(generator, "_call_hf_api", unexpected_single)
+    fc = generate_forecast(name="Ritika", zodiac="Leo", days=3, birth_date="1995-08-20",
+                           start_date=datetime.date(2025, 1, 1))
+    for d in fc:
+        assert f"forecast for {d['date']}" in d["insight"]
@@ -1,5 +1,11 @@
+import datetime
+
+import numpy as np
 import pytest
-from zodiac import infer_zodiac
+
+import zodiac
+from gen_sun_ingress import compute_ingresses
+from zodiac import infer_zodiac, infer_zodiac_bulk
 
 def test_infer_zodiac_known_dates():
     # Basic known-date check: Aug 20 should fall in Leo range
@@ -23,3 +29,59 @@ def test_infer_zodiac_all_signs_present():
     }
     for date_iso, expected in samples.items():
         assert infer_zodiac(date_iso) == expected
+
+def test_infer_zodiac_cusp_uses_birth_time():
+    # March equinox 2000 was at 07:35 UTC
+    assert infer_zodiac("2000-03-20", "07:33") == "Pisces"
+    assert infer_zodiac("2000-03-20", "07:37") == "Aries"
+
+@pytest.mark.parametrize("published, sign", [
+    ("2000-03-20T07:35:00+00:00", "Aries"),      # March equinox
+    ("2024-09-22T12:44:00+00:00", "Libra"),      # September equinox
+    ("2024-12-21T09:20:00+00:00", "Capricorn"),  # December solstice
+])
+def test_ingress_table_matches_published_instants(published, sign):
+    ts = int(datetime.datetime.fromisoformat(published).timestamp())
+    i = int(np.argmin(np.abs(zodiac._INGRESS - ts)))
+    assert zodiac._SIGNS[(zodiac._FIRST_SIGN + i) % 12] == sign
+    assert abs(int(zodiac._INGRESS[i]) - ts) <= 60
+
+def test_infer_zodiac_cusp_uses_timezone():
+    # 13:30 in Kolkata is 08:00 UTC, after the ingress; 12:30 is 07:00 UTC, before it
+    assert infer_zodiac("2000-03-20", "12:30", tz="Asia/Kolkata") == "Pisces"
+    assert infer_zodiac("2000-03-20", "13:30", tz="Asia/Kolkata") == "Aries"
+
+def test_infer_zodiac_outside_table_falls_back():
+    assert infer_zodiac("1850-08-20") == "Leo"
+
+def test_infer_zodiac_bulk_matches_single():
+    dates = ["1995-03-25", "2000-03-20T06:30", "2000-03-20T08:30", "2020-12-21T12:00", "1850-08-20"]
+    singles = [infer_zodiac(*d.split("T")) for d in dates]
+    assert infer_zodiac_bulk(np.array(dates, dtype="datetime64[s]")) == singles
+
+def test_ingress_table_matches_generator():
+    # regenerate one year rather than the full 1900-2100 table to keep the suite fast
+    start = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+    end = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    first_sign, instants = compute_ingresses(start, end)
+    lo = int(np.searchsorted(zodiac._INGRESS, int(start.timestamp())))
+    shipped = zodiac._INGRESS[lo:lo + len(instants)]
+    assert len(instants) == 12
+    assert first_sign == (zodiac._FIRST_SIGN + lo) % 12
+    # allow a second of libm rounding differences across platforms
+    assert np.abs(instants - shipped).max() <= 1
+
+def test_infer_zodiac_bulk_rejects_bad_input():
+    with pytest.raises(ValueError):
+        infer_zodiac_bulk(np.array(["2000-01-01", "NaT"], dtype="datetime64[s]"))
+    with pytest.raises(ValueError):
+        infer_zodiac_bulk(np.array([9.5e8, np.nan]))
+    with pytest.raises(ValueError):
+        infer_zodiac_bulk(np.array([10**15]))
+    with pytest.raises(TypeError):
+        infer_zodiac_bulk(np.array(["2000-01-01"]))
+    with pytest.raises(TypeError):
+        infer_zodiac_bulk([datetime.date(2000, 1, 1)])
+
+def test_infer_zodiac_bulk_accepts_float_seconds():
+    assert infer_zodiac_bulk(np.array([808920000.0])) == ["Leo"]  # 1995-08-20 12:00 UTC
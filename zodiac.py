@@ -1,7 +1,31 @@
 import datetime
-from typing import Optional
+import os
+from bisect import bisect_right
+from typing import Optional, Iterable, List, Union
 
-# Basic sun-sign date ranges (no precession, tropical zodiac)
+import numpy as np
+
+from utils import parse_datetime
+
+_SIGNS = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+          "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
+
+# Precomputed solar ingress instants (Unix seconds, UTC) covering 1900-2100.
+# ingress_utc[i] is the moment the Sun enters _SIGNS[(first_sign + i) % 12].
+# Regenerate with: python gen_sun_ingress.py
+_INGRESS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "sun_ingress.npz")
+
+with np.load(_INGRESS_FILE) as _tbl:
+    _FIRST_SIGN = int(_tbl["first_sign"])
+    _INGRESS = _tbl["ingress_utc"].astype(np.int64)
+# plain list copy: bisect on a list is faster than np.searchsorted for one value
+_INGRESS_LIST = _INGRESS.tolist()
+_SIGNS_ARR = np.array(_SIGNS, dtype=object)
+
+_UTC = datetime.timezone.utc
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=_UTC)
+
+# Fallback sun-sign date ranges for dates outside the ingress table (tropical zodiac)
 # Each entry: (month, day) inclusive start
 _ZODIAC_RANGES = [
     ("Capricorn", (12,22), (1,19)),
@@ -31,19 +55,85 @@ def _in_range(month:int, day:int, start:tuple, end:tuple) -> bool:
         # wraps year (e.g., Dec 22 - Jan 19)
         return (month, day) >= start or (month, day) <= end
 
-def infer_zodiac(birth_date: str, birth_time: Optional[str] = None) -> str:
-    """
-    Infer the sun-sign (zodiac) from birth_date (YYYY-MM-DD). birth_time is optional;
-    cusp handling is simplified (we do NOT compute astronomical positions).
-    Returns: one of the 12 zodiac names.
-    Assumptions: tropical zodiac date ranges (fixed calendar ranges).
-    """
-    dt = datetime.date.fromisoformat(birth_date)
-    month = dt.month
-    day = dt.day
-
+def _calendar_zodiac(month: int, day: int) -> str:
     for name, start, end in _ZODIAC_RANGES:
         if _in_range(month, day, start, end):
             return name
     # fallback
     return "Capricorn"
+
+def _to_unix(dt: datetime.datetime) -> int:
+    # naive datetimes are taken as UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    return int(dt.timestamp())
+
+def _datetime_to_unix(d) -> int:
+    if not isinstance(d, datetime.datetime):
+        raise TypeError(
+            "infer_zodiac_bulk expects datetime64 values, int/float Unix seconds "
+            f"or datetime.datetime objects, got {type(d).__name__}")
+    return _to_unix(d)
+
+def _lookup(ts: int) -> Optional[str]:
+    i = bisect_right(_INGRESS_LIST, ts) - 1
+    if i < 0 or i >= len(_INGRESS_LIST) - 1:
+        return None
+    return _SIGNS[(_FIRST_SIGN + i) % 12]
+
+def infer_zodiac(birth_date: str, birth_time: Optional[str] = None, tz: Optional[str] = None) -> str:
+    """
+    Infer the sun-sign (zodiac) from birth_date (YYYY-MM-DD), optional birth_time (HH:MM)
+    and optional IANA timezone name (e.g. "Asia/Kolkata").
+    The birth instant is looked up in the precomputed solar ingress table, so cusp days
+    resolve to the correct sign. Without tz the time is taken as UTC; without birth_time
+    noon is assumed.
+    Returns: one of the 12 zodiac names.
+    Dates outside 1900-2100 fall back to fixed calendar ranges.
+    """
+    dt = parse_datetime(birth_date, birth_time or "12:00", tz_override=tz)
+    sign = _lookup(_to_unix(dt))
+    if sign is not None:
+        return sign
+    return _calendar_zodiac(dt.month, dt.day)
+
+def infer_zodiac_bulk(instants: Union[np.ndarray, Iterable[datetime.datetime]]) -> List[str]:
+    """
+    Vectorized lookup for batch jobs.
+    instants: numpy datetime64 array (UTC), int or float Unix seconds, or datetimes
+    (naive ones are taken as UTC).
+    Returns: zodiac names in input order.
+    Raises: ValueError for NaT/NaN/inf or instants outside the datetime range,
+    TypeError for any other input type.
+    """
+    arr = np.asarray(instants)
+    if arr.dtype.kind == "M":
+        if np.isnat(arr).any():
+            raise ValueError("infer_zodiac_bulk got NaT")
+        ts = arr.astype("datetime64[s]").astype(np.int64)
+    elif arr.dtype.kind in "iu":
+        ts = arr.astype(np.int64)
+    elif arr.dtype.kind == "f":
+        if not np.isfinite(arr).all():
+            raise ValueError("infer_zodiac_bulk got NaN or infinite seconds")
+        if (np.abs(arr) >= 2.0**62).any():
+            raise ValueError("infer_zodiac_bulk got seconds outside the supported datetime range")
+        ts = np.floor(arr).astype(np.int64)
+    elif arr.dtype.kind == "O":
+        ts = np.fromiter((_datetime_to_unix(d) for d in arr.ravel()), dtype=np.int64, count=arr.size)
+    else:
+        raise TypeError(
+            "infer_zodiac_bulk expects datetime64 values, int/float Unix seconds "
+            f"or datetime.datetime objects, got array of dtype {arr.dtype}")
+    ts = ts.ravel()
+
+    idx = np.searchsorted(_INGRESS, ts, side="right") - 1
+    in_range = (idx >= 0) & (idx < len(_INGRESS) - 1)
+    out = _SIGNS_ARR[(_FIRST_SIGN + idx) % 12]
+    for j in np.flatnonzero(~in_range):
+        try:
+            d = _EPOCH + datetime.timedelta(seconds=int(ts[j]))
+        except OverflowError:
+            raise ValueError(f"instant {int(ts[j])} is outside the supported datetime range") from None
+        out[j] = _calendar_zodiac(d.month, d.day)
+    return out.tolist()